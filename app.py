@@ -5,8 +5,8 @@ from src.model import load_trained_model, make_prediction
 from src.eda_plots import df   # Needed for dynamic dropdown callback
 
 
-# Initialize Dash
-app = dash.Dash(__name__)
+# Initialize Dash (compress=True gzips layout and callback responses)
+app = dash.Dash(__name__, compress=True)
 server = app.server
 
 # Load the trained model once
@@ -12,9 +12,33 @@ from src.eda_plots import (
     plot_employment_boxplot,
     plot_disparity_histogram
 )
+from src.utils import compact_figure, FIGURE_DECIMALS
+
+
+def dashboard_figures():
+    """Build the ten EDA figures shown on the dashboard, keyed by name."""
+    return {
+        "national_trend": plot_national_trend(),
+        "income_trend": plot_income_trend(),
+        "age_groups": plot_age_groups(),
+        "race_groups": plot_race_groups(),
+        "income_groups": plot_income_groups(),
+        "employment_groups": plot_employment_groups(),
+        "mental_health_scatter": plot_mental_health_scatter(),
+        "prevalence_vs_disparity": plot_prevalence_vs_disparity(),
+        "employment_boxplot": plot_employment_boxplot(),
+        "disparity_histogram": plot_disparity_histogram(),
+    }
 
 
 def create_layout():
+    # Serialize figures compactly: numeric arrays as typed binary buffers or
+    # rounded lists, and only the template data each chart actually uses
+    figures = {
+        name: compact_figure(fig, FIGURE_DECIMALS)
+        for name, fig in dashboard_figures().items()
+    }
+
     return html.Div(
         style={"padding": "20px"},
         children=[
@@ -26,49 +50,49 @@ def create_layout():
             # ===================================
             html.H2("1. National Smoking Trend Over Time"),
             html.P("Shows the national decline in smoking prevalence from 2000 to 2023."),
-            dcc.Graph(figure=plot_national_trend()),
+            dcc.Graph(figure=figures["national_trend"]),
 
             html.H2("2. Smoking Trend by Income Group"),
             html.P("Lower-income groups consistently have higher smoking prevalence."),
-            dcc.Graph(figure=plot_income_trend()),
+            dcc.Graph(figure=figures["income_trend"]),
 
             html.Hr(),
 
             html.H2("3. Smoking by Age Group"),
             html.P("Younger adults (18–24) show the highest smoking prevalence."),
-            dcc.Graph(figure=plot_age_groups()),
+            dcc.Graph(figure=figures["age_groups"]),
 
             html.H2("4. Smoking by Race/Ethnicity"),
             html.P("American Indian/Alaska Native groups show the highest smoking prevalence."),
-            dcc.Graph(figure=plot_race_groups()),
+            dcc.Graph(figure=figures["race_groups"]),
 
             html.H2("5. Smoking by Income Group"),
             html.P("Clear socioeconomic gradient: lower income groups smoke more."),
-            dcc.Graph(figure=plot_income_groups()),
+            dcc.Graph(figure=figures["income_groups"]),
 
             html.H2("6. Smoking by Employment Status"),
             html.P("Unemployed individuals show higher smoking prevalence."),
-            dcc.Graph(figure=plot_employment_groups()),
+            dcc.Graph(figure=figures["employment_groups"]),
 
             html.Hr(),
 
             html.H2("7. Mental Health vs Smoking Prevalence"),
             html.P("Individuals with psychological distress show higher smoking rates."),
-            dcc.Graph(figure=plot_mental_health_scatter()),
+            dcc.Graph(figure=figures["mental_health_scatter"]),
 
             html.H2("8. Smoking Prevalence vs Disparity Value"),
             html.P("Higher smoking prevalence often corresponds with higher disparities."),
-            dcc.Graph(figure=plot_prevalence_vs_disparity()),
+            dcc.Graph(figure=figures["prevalence_vs_disparity"]),
 
             html.Hr(),
 
             html.H2("9. Smoking Distribution by Employment Status"),
             html.P("Unemployed groups show greater variability in smoking prevalence."),
-            dcc.Graph(figure=plot_employment_boxplot()),
+            dcc.Graph(figure=figures["employment_boxplot"]),
 
             html.H2("10. Distribution of Disparity Values"),
             html.P("Most disparities cluster near zero with spikes for vulnerable groups."),
-            dcc.Graph(figure=plot_disparity_histogram()),
+            dcc.Graph(figure=figures["disparity_histogram"]),
 
             html.Hr(),
 
@@ -0,0 +1,305 @@
+import base64
+import gzip
+import time
+
+import numpy as np
+import plotly.graph_objects as go
+from plotly.io.json import to_json_plotly
+
+# Typed-array codes understood by plotly.js ("bdata" format). There is no
+# 64-bit integer type, so integers must fit in 32 bits to be sent as binary.
+INT_DTYPES = ["i1", "u1", "i2", "u2", "i4", "u4"]
+
+# The CDC source data reports prevalence and disparity values to one decimal
+# place, so derived values (group means) carry no real information beyond this.
+FIGURE_DECIMALS = 2
+
+
+# -----------------------------------------------------------------------------
+# NUMERIC ARRAY ENCODING
+# -----------------------------------------------------------------------------
+def decode_bdata(value):
+    """
+    Decode a plotly typed-array dict ({"dtype", "bdata", "shape"}) into numpy.
+    """
+    array = np.frombuffer(
+        base64.b64decode(value["bdata"]),
+        dtype=np.dtype(value["dtype"]).newbyteorder("<"),
+    )
+
+    shape = value.get("shape")
+    if shape:
+        if isinstance(shape, str):
+            shape = [int(s) for s in shape.split(",")]
+        array = array.reshape(shape)
+
+    return array
+
+
+def encode_bdata(array):
+    """
+    Encode a numpy array as a plotly typed-array dict.
+    """
+    array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+    encoded = {
+        "dtype": array.dtype.str[1:],
+        "bdata": base64.b64encode(array.tobytes()).decode("ascii"),
+    }
+
+    if array.ndim > 1:
+        encoded["shape"] = ", ".join(str(s) for s in array.shape)
+
+    return encoded
+
+
+def smallest_int_dtype(array):
+    """
+    Return the narrowest plotly integer dtype that can hold every value,
+    or None if the values do not fit in 32 bits.
+    """
+    low, high = array.min(), array.max()
+
+    for code in INT_DTYPES:
+        info = np.iinfo(code)
+        if info.min <= low and high <= info.max:
+            return code
+
+    return None
+
+
+def infer_decimals(array, max_decimals=6):
+    """
+    Return the fewest decimal places that represent every value exactly,
+    or None if the values need more than `max_decimals`.
+    """
+    for decimals in range(max_decimals + 1):
+        if np.array_equal(np.round(array, decimals), array):
+            return decimals
+
+    return None
+
+
+def compact_array(array, decimals=None):
+    """
+    Encode a numeric array in its smallest faithful form.
+
+    - integral values become the narrowest typed binary buffer
+    - float values are rounded to `decimals` (or their inferred precision)
+      and sent as whichever of a plain JSON list or an f8 buffer is shorter
+    - missing values (NaN) are kept: as NaN in buffers, as null in lists,
+      both of which plotly.js draws as gaps
+    """
+    if array.size == 0:
+        return array.tolist()
+
+    array = array.astype("f8") if array.dtype.kind == "f" else array
+    missing = ~np.isfinite(array) if array.dtype.kind == "f" else None
+    values = array[~missing] if missing is not None else array
+
+    if values.size and np.array_equal(np.round(values), values):
+        if missing is None or not missing.any():
+            code = smallest_int_dtype(values)
+            if code is not None:
+                return encode_bdata(array.astype(code))
+        elif np.abs(values).max() < 2 ** 24:
+            # f4 holds every integer below 2**24 exactly, and NaN
+            return encode_bdata(array.astype("f4"))
+
+    if decimals is None:
+        decimals = infer_decimals(values)
+
+    if decimals is None:
+        return encode_bdata(array)
+
+    rounded = np.round(array, decimals)
+    as_list = rounded.tolist()
+    if missing is not None and missing.any():
+        as_list = np.where(missing, None, rounded).tolist()
+    as_bdata = encode_bdata(rounded)
+
+    # Each list entry costs its digits plus a separator; each f8 costs
+    # 8 bytes, which base64 inflates to ~10.7 characters.
+    if len(to_json_plotly(as_list)) < len(as_bdata["bdata"]):
+        return as_list
+
+    return as_bdata
+
+
+def as_numeric_array(value):
+    """
+    Return `value` as a numeric numpy array, or None if it is not one.
+    """
+    if isinstance(value, dict):
+        if "bdata" in value and "dtype" in value:
+            return decode_bdata(value)
+        return None
+
+    if isinstance(value, (list, tuple)):
+        if not value or any(isinstance(v, (bool, str)) or v is None for v in value):
+            return None
+        try:
+            value = np.asarray(value)
+        except ValueError:
+            return None
+
+    if isinstance(value, np.ndarray) and value.dtype.kind in "iuf":
+        return value
+
+    return None
+
+
+def compact_value(value, decimals=None):
+    """
+    Recursively replace numeric arrays inside a trace attribute.
+    """
+    array = as_numeric_array(value)
+    if array is not None:
+        return compact_array(array, decimals)
+
+    if isinstance(value, dict):
+        return {k: compact_value(v, decimals) for k, v in value.items()}
+
+    return value
+
+
+# -----------------------------------------------------------------------------
+# FIGURE SERIALIZATION
+# -----------------------------------------------------------------------------
+def strip_template(layout, trace_types):
+    """
+    Keep only the template defaults for trace types the figure actually uses.
+
+    The default plotly template carries styling for ~25 trace types; a bar
+    chart only needs the "bar" entry, so the rest is dead weight in the payload.
+    """
+    template = layout.get("template")
+    if not template:
+        return layout
+
+    template = dict(template)
+    template["data"] = {
+        k: v for k, v in template.get("data", {}).items() if k in trace_types
+    }
+
+    return {**layout, "template": template}
+
+
+def compact_figure(fig, decimals=None):
+    """
+    Convert a plotly figure into a compact dict for dcc.Graph.
+
+    Numeric trace arrays are sent as typed binary buffers or rounded lists
+    (see compact_array) and unused template data is dropped. The result
+    renders identically and can be passed straight to dcc.Graph(figure=...).
+    """
+    if isinstance(fig, go.Figure):
+        fig = fig.to_plotly_json()
+
+    data = [
+        {k: compact_value(v, decimals) for k, v in trace.items()}
+        for trace in fig.get("data", [])
+    ]
+    trace_types = {trace.get("type", "scatter") for trace in data}
+    layout = strip_template(fig.get("layout", {}), trace_types)
+
+    return {"data": data, "layout": layout}
+
+
+# -----------------------------------------------------------------------------
+# PAYLOAD MEASUREMENT
+# -----------------------------------------------------------------------------
+def measure_payload(fig, repeat=5):
+    """
+    Return payload size (raw and gzipped, in bytes) and the best-of-`repeat`
+    JSON encode time (in ms) for a figure, as Dash would serialize it.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        payload = to_json_plotly(fig)
+        timings.append(time.perf_counter() - start)
+
+    encoded = payload.encode("utf-8")
+
+    return {
+        "bytes": len(encoded),
+        "gzip_bytes": len(gzip.compress(encoded)),
+        "encode_ms": min(timings) * 1000,
+    }
+
+
+def compare_payloads(figures, decimals=FIGURE_DECIMALS):
+    """
+    Measure each figure before and after compact_figure().
+
+    `figures` maps a chart name to a plotly figure. Returns one row per chart.
+    """
+    rows = []
+
+    for name, fig in figures.items():
+        start = time.perf_counter()
+        compact = compact_figure(fig, decimals)
+        compact_ms = (time.perf_counter() - start) * 1000
+
+        before = measure_payload(fig)
+        after = measure_payload(compact)
+
+        rows.append({
+            "chart": name,
+            "before": before,
+            "after": after,
+            "compact_ms": compact_ms,
+        })
+
+    return rows
+
+
+def print_payload_report(rows):
+    """
+    Print a before/after table of payload bytes and encode time.
+    """
+    header = (
+        f"{'chart':<30} {'bytes':>10} {'gzip':>9} {'enc ms':>8}"
+        f" | {'bytes':>9} {'gzip':>8} {'enc ms':>7} {'compact ms':>10}"
+    )
+    print(f"{'':<30} {'--------- before ---------':>29} | {'------------- after -------------':>37}")
+    print(header)
+    print("-" * len(header))
+
+    totals = {"before": [0, 0, 0.0], "after": [0, 0, 0.0]}
+
+    for row in rows:
+        for key in totals:
+            totals[key][0] += row[key]["bytes"]
+            totals[key][1] += row[key]["gzip_bytes"]
+            totals[key][2] += row[key]["encode_ms"]
+
+        b, a = row["before"], row["after"]
+        print(
+            f"{row['chart']:<30} {b['bytes']:>10,} {b['gzip_bytes']:>9,} {b['encode_ms']:>8.2f}"
+            f" | {a['bytes']:>9,} {a['gzip_bytes']:>8,} {a['encode_ms']:>7.2f} {row['compact_ms']:>10.2f}"
+        )
+
+    print("-" * len(header))
+    b, a = totals["before"], totals["after"]
+    print(
+        f"{'TOTAL':<30} {b[0]:>10,} {b[1]:>9,} {b[2]:>8.2f}"
+        f" | {a[0]:>9,} {a[1]:>8,} {a[2]:>7.2f}"
+    )
+
+
+# -----------------------------------------------------------------------------
+# MAIN EXECUTION FUNCTION
+# -----------------------------------------------------------------------------
+# Running `python -m src.utils` builds the ten dashboard charts and reports,
+# for each one, the JSON payload size (raw and gzipped) and encode time before
+# and after compact_figure(). Requires data/cleaned/final_cleaned_data.csv.
+# -----------------------------------------------------------------------------
+def main():
+    from src.layout import dashboard_figures
+
+    print_payload_report(compare_payloads(dashboard_figures()))
+
+
+if __name__ == "__main__":
+    main()